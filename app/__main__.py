@@ -0,0 +1,26 @@
+"""Run the application under uvicorn with the tuned event loop stack."""
+
+import os
+
+import uvicorn
+
+from app.config import get_settings
+
+
+def main() -> None:
+    """Start uvicorn with uvloop and httptools for cheaper event-loop dispatch."""
+
+    settings = get_settings()
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=settings.port,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Application settings loaded from environment variables."""
 
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Literal
 
@@ -20,6 +21,7 @@ class Settings(BaseSettings):
     )
     port: int = Field(default=8000, alias="PORT")
     max_text_length: int = Field(default=1000, alias="MAX_TEXT_LENGTH")
+    tts_cache_size: int = Field(default=512, alias="TTS_CACHE_SIZE")
     ws_inactivity_timeout: float = Field(
         default=30.0, alias="WS_INACTIVITY_TIMEOUT", description="Seconds"
     )
@@ -34,3 +36,32 @@ def get_settings() -> Settings:
     """Return a cached instance of settings."""
 
     return Settings()
+
+
+@dataclass(slots=True, frozen=True)
+class RuntimeConfig:
+    """Immutable snapshot of :class:`Settings` for hot-path attribute access.
+
+    Slot reads are a single C-level lookup, whereas pydantic model attribute
+    access goes through several Python-level dispatches per read.
+    """
+
+    openai_api_key: str
+    chat_model: str
+    tts_model: str
+    tts_voice: str
+    environment: str
+    log_level: str
+    port: int
+    max_text_length: int
+    tts_cache_size: int
+    ws_inactivity_timeout: float
+    chat_timeout: float
+    tts_timeout: float
+
+
+@lru_cache
+def build_runtime_config() -> RuntimeConfig:
+    """Freeze the validated settings into a runtime snapshot."""
+
+    return RuntimeConfig(**get_settings().model_dump())
@@ -1,33 +1,37 @@
 """Dependency providers for the FastAPI application."""
 
 import httpx
-from fastapi import Depends
 from starlette.requests import HTTPConnection
 
-from app.config import Settings, get_settings
+from app.config import RuntimeConfig, build_runtime_config
 from app.services.chat_service import ChatService
 from app.services.tts_service import TtsService
 
 
+async def get_runtime_config(connection: HTTPConnection) -> RuntimeConfig:
+    """Retrieve the frozen runtime configuration snapshot.
+
+    Falls back to building the snapshot directly when the lifespan has not
+    run, e.g. under the synchronous test client.
+    """
+
+    cfg: RuntimeConfig | None = getattr(connection.app.state, "cfg", None)
+    return cfg if cfg is not None else build_runtime_config()
+
+
 async def get_http_client(connection: HTTPConnection) -> httpx.AsyncClient:
     """Retrieve the shared AsyncClient from application state."""
 
     return connection.app.state.http_client  # type: ignore[return-value]
 
 
-async def get_chat_service(
-    client: httpx.AsyncClient = Depends(get_http_client),
-    settings: Settings = Depends(get_settings),
-) -> ChatService:
-    """Dependency provider for ChatService."""
+async def get_chat_service(connection: HTTPConnection) -> ChatService:
+    """Retrieve the shared ChatService built during startup."""
 
-    return ChatService(client=client, settings=settings)
+    return connection.app.state.chat_service  # type: ignore[return-value]
 
 
-async def get_tts_service(
-    client: httpx.AsyncClient = Depends(get_http_client),
-    settings: Settings = Depends(get_settings),
-) -> TtsService:
-    """Dependency provider for TtsService."""
+async def get_tts_service(connection: HTTPConnection) -> TtsService:
+    """Retrieve the shared TtsService built during startup."""
 
-    return TtsService(client=client, settings=settings)
+    return connection.app.state.tts_service  # type: ignore[return-value]
@@ -1,10 +1,42 @@
 """Logging configuration utilities."""
 
-import json
 import logging
+import os
 import sys
 from typing import Any, MutableMapping
 
+import orjson
+
+# Attributes every LogRecord carries; anything else came in via extra= and
+# belongs in the rendered payload. Precomputed so format() filters with a
+# single frozenset lookup per key.
+_RESERVED = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "message",
+    }
+)
+
 
 class JsonFormatter(logging.Formatter):
     """Formatter that renders log records as JSON lines."""
@@ -20,15 +52,25 @@ class JsonFormatter(logging.Formatter):
             payload["exc_info"] = self.formatException(record.exc_info)
 
         for key, value in record.__dict__.items():
-            if key.startswith("_") or key in payload:
-                continue
-
-            if key in {"args", "msg"}:
+            if key in _RESERVED or key.startswith("_"):
                 continue
 
             payload[key] = value
 
-        return json.dumps(payload, default=str)
+        return orjson.dumps(payload, default=str).decode()
+
+
+def emit_event(event: str, **fields: Any) -> None:
+    """Write a structured INFO line straight to stdout.
+
+    Bypasses LogRecord construction, handler iteration, and formatter
+    dispatch for per-frame hot-path events; error paths should keep using
+    the regular logger.
+    """
+
+    payload: MutableMapping[str, Any] = {"level": "INFO", "message": event}
+    payload.update(fields)
+    os.write(1, orjson.dumps(payload, default=str) + b"\n")
 
 
 def configure_logging(level: str) -> None:
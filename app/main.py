@@ -9,8 +9,10 @@ import httpx
 from fastapi import Depends, FastAPI
 
 from app import __version__
-from app.config import Settings, get_settings
+from app.config import Settings, build_runtime_config, get_settings
 from app.logging import configure_logging
+from app.services.chat_service import ChatService
+from app.services.tts_service import TtsService
 from app.websocket_handlers import websocket_endpoint
 
 
@@ -18,9 +20,32 @@ from app.websocket_handlers import websocket_endpoint
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Create application resources during startup and clean up on shutdown."""
 
-    async with httpx.AsyncClient() as client:
+    settings = get_settings()
+    async with httpx.AsyncClient(
+        base_url="https://api.openai.com",
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=100,
+            max_connections=200,
+            keepalive_expiry=60.0,
+        ),
+        timeout=httpx.Timeout(
+            connect=5.0,
+            read=settings.tts_timeout,
+            write=5.0,
+            pool=5.0,
+        ),
+    ) as client:
         app.state.http_client = client
+        app.state.cfg = build_runtime_config()
+        # Services are fully determined by startup-time config, so build them
+        # once instead of per connection through the dependency chain.
+        app.state.chat_service = ChatService(client=client, settings=settings)
+        app.state.tts_service = TtsService(client=client, settings=settings)
         yield
+        del app.state.tts_service
+        del app.state.chat_service
+        del app.state.cfg
         del app.state.http_client
 
 
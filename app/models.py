@@ -1,11 +1,13 @@
 """Pydantic models shared across application layers."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageIn(BaseModel):
     """Incoming WebSocket payload."""
 
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     text: str = Field(min_length=1, description="User supplied text prompt.")
 
 
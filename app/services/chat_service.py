@@ -3,23 +3,39 @@
 from __future__ import annotations
 
 import logging
+from typing import AsyncIterator
 
 import httpx
+import orjson
 
 from app.config import Settings
 from app.exceptions import ChatServiceError
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful assistant."}
+
 
 class ChatService:
     """Wrapper around OpenAI's chat completions endpoint."""
 
-    _endpoint = "https://api.openai.com/v1/chat/completions"
+    _endpoint = "/v1/chat/completions"
 
     def __init__(self, client: httpx.AsyncClient, settings: Settings) -> None:
         self._client = client
         self._settings = settings
+        self._timeout = httpx.Timeout(
+            connect=5.0, read=settings.chat_timeout, write=5.0, pool=5.0
+        )
+        # httpx.Headers is built once here so httpx reuses the already
+        # case-normalized, byte-encoded headers instead of rebuilding them
+        # from a dict on every request.
+        self._headers = httpx.Headers(
+            {
+                "Authorization": f"Bearer {settings.openai_api_key}",
+                "Content-Type": "application/json",
+            }
+        )
 
     async def complete(self, prompt: str) -> str:
         """Generate a chat completion from OpenAI."""
@@ -27,22 +43,17 @@ class ChatService:
         payload = {
             "model": self._settings.chat_model,
             "messages": [
-                {"role": "system", "content": "You are a helpful assistant."},
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt},
             ],
         }
 
-        headers = {
-            "Authorization": f"Bearer {self._settings.openai_api_key}",
-            "Content-Type": "application/json",
-        }
-
         try:
             response = await self._client.post(
                 self._endpoint,
-                headers=headers,
-                json=payload,
-                timeout=self._settings.chat_timeout,
+                headers=self._headers,
+                content=orjson.dumps(payload),
+                timeout=self._timeout,
             )
             response.raise_for_status()
         except httpx.TimeoutException as exc:
@@ -77,3 +88,62 @@ class ChatService:
             raise ChatServiceError("Chat service returned empty content")
 
         return content.strip()
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream chat-completion content deltas from OpenAI as they arrive."""
+
+        payload = {
+            "model": self._settings.chat_model,
+            "messages": [
+                _SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt},
+            ],
+            "stream": True,
+        }
+
+        try:
+            async with self._client.stream(
+                "POST",
+                self._endpoint,
+                headers=self._headers,
+                content=orjson.dumps(payload),
+                timeout=self._timeout,
+            ) as response:
+                if response.is_error:
+                    # Read the body while the stream is still open so the
+                    # status handler below can log response.text.
+                    await response.aread()
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        event = orjson.loads(data)
+                        delta = event["choices"][0]["delta"]
+                    except (orjson.JSONDecodeError, KeyError, IndexError, TypeError) as exc:
+                        logger.error("Malformed chat stream event", extra={"raw_event": data})
+                        raise ChatServiceError("Invalid chat response payload") from exc
+                    content = delta.get("content")
+                    if content:
+                        yield content
+        except httpx.TimeoutException as exc:
+            logger.warning("Chat completion timed out", exc_info=exc)
+            raise ChatServiceError("Chat service timed out") from exc
+        except httpx.HTTPStatusError as exc:
+            logger.error(
+                "Chat completion failed",
+                extra={
+                    "status_code": exc.response.status_code,
+                    "response_text": exc.response.text,
+                },
+            )
+            raise ChatServiceError(
+                "Chat service returned an error",
+                status_code=exc.response.status_code,
+            ) from exc
+        except httpx.HTTPError as exc:
+            logger.exception("Unexpected chat HTTP error")
+            raise ChatServiceError("Chat service request failed") from exc
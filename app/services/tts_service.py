@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import suppress
+from hashlib import blake2b
+from typing import AsyncIterator
 
 import httpx
+import orjson
+from cachetools import LRUCache
 
 from app.config import Settings
 from app.exceptions import TtsServiceError
@@ -15,15 +21,84 @@ logger = logging.getLogger(__name__)
 class TtsService:
     """Wrapper around OpenAI's TTS endpoint."""
 
-    _endpoint = "https://api.openai.com/v1/audio/speech"
+    _endpoint = "/v1/audio/speech"
     _output_format = "audio/mpeg"
+    _chunk_size = 16384
 
     def __init__(self, client: httpx.AsyncClient, settings: Settings) -> None:
         self._client = client
         self._settings = settings
+        self._timeout = httpx.Timeout(
+            connect=5.0, read=settings.tts_timeout, write=5.0, pool=5.0
+        )
+        # Built once as httpx.Headers so the case-normalized, byte-encoded
+        # form is reused across requests.
+        self._headers = httpx.Headers(
+            {
+                "Authorization": f"Bearer {settings.openai_api_key}",
+                "Content-Type": "application/json",
+                "Accept": self._output_format,
+            }
+        )
+        self._cache: LRUCache[bytes, bytes] = LRUCache(maxsize=settings.tts_cache_size)
+        self._cache_key_seed = (settings.tts_model + ":" + settings.tts_voice).encode()[:16]
+        self._inflight: dict[bytes, asyncio.Lock] = {}
 
-    async def synthesize(self, text: str) -> bytes:
-        """Generate speech audio for the supplied text."""
+    async def synthesize(self, text: str) -> AsyncIterator[bytes]:
+        """Stream speech audio for the supplied text, serving repeats from cache."""
+
+        key = self._cache_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        # Per-key lock so concurrent requests for the same prompt hit OpenAI
+        # once; later arrivals read the freshly cached bytes instead.
+        lock = self._inflight.setdefault(key, asyncio.Lock())
+        async with lock:
+            try:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    yield cached
+                    return
+
+                buffered = bytearray()
+                async for chunk in self._fetch(text):
+                    buffered.extend(chunk)
+                    yield chunk
+                self._cache[key] = bytes(buffered)
+            finally:
+                self._inflight.pop(key, None)
+
+    async def warm(self) -> None:
+        """Force connection establishment to the TTS endpoint ahead of use.
+
+        The GET is expected to be rejected (the endpoint only accepts POST);
+        its sole purpose is to pay the TLS/HTTP handshake before the first
+        synthesize call. Every invocation issues a real request, so callers
+        should warm at most once per connection and let the pooled socket
+        serve everything after that.
+        """
+
+        with suppress(httpx.HTTPError):
+            await self._client.get(
+                self._endpoint, headers=self._headers, timeout=self._timeout
+            )
+
+    def _cache_key(self, text: str) -> bytes:
+        """Hash the prompt under a (model, voice) keyed digest.
+
+        A 16-byte digest is ample for a per-process cache and halves the
+        key memory compared to the default 64-byte output.
+        """
+
+        return blake2b(
+            text.encode("utf-8"), key=self._cache_key_seed, digest_size=16
+        ).digest()
+
+    async def _fetch(self, text: str) -> AsyncIterator[bytes]:
+        """Stream speech audio for the supplied text as it arrives from OpenAI."""
 
         payload = {
             "model": self._settings.tts_model,
@@ -32,20 +107,23 @@ class TtsService:
             "format": "mp3",
         }
 
-        headers = {
-            "Authorization": f"Bearer {self._settings.openai_api_key}",
-            "Content-Type": "application/json",
-            "Accept": self._output_format,
-        }
-
+        total = 0
         try:
-            response = await self._client.post(
+            async with self._client.stream(
+                "POST",
                 self._endpoint,
-                headers=headers,
-                json=payload,
-                timeout=self._settings.tts_timeout,
-            )
-            response.raise_for_status()
+                headers=self._headers,
+                content=orjson.dumps(payload),
+                timeout=self._timeout,
+            ) as response:
+                if response.is_error:
+                    # Read the body while the stream is still open so the
+                    # status handler below can log response.text.
+                    await response.aread()
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(self._chunk_size):
+                    total += len(chunk)
+                    yield chunk
         except httpx.TimeoutException as exc:
             logger.warning("TTS synthesis timed out", exc_info=exc)
             raise TtsServiceError("Text-to-speech service timed out") from exc
@@ -65,8 +143,5 @@ class TtsService:
             logger.exception("Unexpected TTS HTTP error")
             raise TtsServiceError("Text-to-speech request failed") from exc
 
-        audio_bytes = response.content
-        if not audio_bytes:
+        if total == 0:
             raise TtsServiceError("Text-to-speech service returned empty payload")
-
-        return audio_bytes
@@ -7,86 +7,134 @@ import logging
 from contextlib import suppress
 from typing import Annotated
 
+import orjson
 from fastapi import Depends, WebSocket, WebSocketDisconnect, status
 from starlette.websockets import WebSocketState
 
-from app.config import Settings, get_settings
-from app.dependencies import get_chat_service, get_tts_service
+from app.config import RuntimeConfig
+from app.dependencies import get_chat_service, get_runtime_config, get_tts_service
 from app.exceptions import ChatServiceError, TtsServiceError
-from app.models import ErrorResponse, MessageIn
+from app.logging import emit_event
+from app.models import ErrorResponse
 from app.services.chat_service import ChatService
 from app.services.tts_service import TtsService
 
 logger = logging.getLogger(__name__)
 
+_END_OF_STREAM_FRAME = orjson.dumps({"event": "end"}).decode()
+
+# Error frames with fixed content, serialized once at import time so the hot
+# path sends them without any per-message allocation.
+_ERR_INVALID_JSON_FRAME = orjson.dumps(
+    {"error": "invalid_payload", "detail": "Invalid JSON payload."}
+).decode()
+_ERR_EMPTY_TEXT_FRAME = orjson.dumps(
+    {"error": "validation_error", "detail": "Text must not be empty."}
+).decode()
+
+_SENTENCE_TERMINATORS = frozenset(".!?")
+
+# Bounded pipeline depth: how many sentences may be in TTS flight while the
+# chat stream keeps producing. Provides back-pressure against a fast LLM.
+_PIPELINE_DEPTH = 4
+
+# Coalesce outgoing audio into frames of at least this size when more audio
+# is already queued; many small frames cost a syscall + WebSocket framing
+# each, while a waiting client gains nothing from sub-frame granularity.
+_SEND_COALESCE_BYTES = 65536
+
 
 async def websocket_endpoint(
     websocket: WebSocket,
     chat_service: Annotated[ChatService, Depends(get_chat_service)],
     tts_service: Annotated[TtsService, Depends(get_tts_service)],
-    settings: Annotated[Settings, Depends(get_settings)],
+    cfg: Annotated[RuntimeConfig, Depends(get_runtime_config)],
 ) -> None:
     """Main WebSocket workflow: text → chat → TTS → audio bytes."""
 
     await websocket.accept()
     should_close = True
-    logger.info(
-        "WebSocket connection accepted",
-        extra={"client": _client_repr(websocket)},
-    )
+    # Bind the enum attributes to locals once: LOAD_FAST in the loop instead
+    # of a LOAD_GLOBAL + LOAD_ATTR chain per use.
+    normal_closure = status.WS_1000_NORMAL_CLOSURE
+    connected = WebSocketState.CONNECTED
+    client_str = _client_repr(websocket)
+    log_extra = {"client": client_str}
+    logger.info("WebSocket connection accepted", extra=log_extra)
 
+    # One receive task is kept alive across iterations; asyncio.wait on an
+    # existing task avoids the Task + timer handle that asyncio.wait_for
+    # allocates per inbound frame.
+    recv_task = asyncio.ensure_future(websocket.receive_text())
+    # Pre-establish the TTS connection once per connection; later synthesize
+    # calls reuse the pooled HTTP/2 socket, so repeating the warm-up would
+    # only burn rate limit on guaranteed-4xx requests.
+    warm_task = asyncio.create_task(tts_service.warm())
     try:
         while True:
-            try:
-                message = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=settings.ws_inactivity_timeout,
-                )
-            except asyncio.TimeoutError:
-                logger.info(
-                    "WebSocket inactive; closing",
-                    extra={"client": _client_repr(websocket)},
-                )
-                await websocket.close(code=status.WS_1000_NORMAL_CLOSURE)
+            done, _ = await asyncio.wait(
+                {recv_task}, timeout=cfg.ws_inactivity_timeout
+            )
+            if not done:
+                logger.info("WebSocket inactive; closing", extra=log_extra)
+                await websocket.close(code=normal_closure)
                 should_close = False
                 break
+
+            try:
+                message = recv_task.result()
             except WebSocketDisconnect:
-                logger.info(
-                    "WebSocket client disconnected",
-                    extra={"client": _client_repr(websocket)},
-                )
+                logger.info("WebSocket client disconnected", extra=log_extra)
                 should_close = False
                 break
+            recv_task = asyncio.ensure_future(websocket.receive_text())
 
-            try:
-                payload = MessageIn.model_validate_json(message)
-            except ValueError:
+            # Reject oversized frames from the raw length alone, before paying
+            # for the JSON scan: *6 covers \uXXXX escaping of every character
+            # (ensure_ascii clients), +64 covers the framing.
+            if len(message) > cfg.max_text_length * 6 + 64:
                 await _send_error(
                     websocket,
-                    ErrorResponse(error="invalid_payload", detail="Invalid JSON payload."),
+                    ErrorResponse(
+                        error="validation_error",
+                        detail=f"Text length exceeds limit of {cfg.max_text_length} characters.",
+                    ),
                 )
                 continue
 
-            text = payload.text.strip()
+            # Hand-rolled validation of the tiny MessageIn schema; orjson parses
+            # in C and skips pydantic-core dispatch on every inbound frame.
+            try:
+                payload = orjson.loads(message)
+            except orjson.JSONDecodeError:
+                payload = None
+            text_field = payload.get("text") if isinstance(payload, dict) else None
+            if not isinstance(text_field, str) or not text_field:
+                await websocket.send_text(_ERR_INVALID_JSON_FRAME)
+                continue
+
+            # Only pay for the strip (and its copy) when the boundary
+            # characters are actually whitespace; clean input is the norm.
+            if text_field[0].isspace() or text_field[-1].isspace():
+                text = text_field.strip()
+            else:
+                text = text_field
             if len(text) == 0:
-                await _send_error(
-                    websocket,
-                    ErrorResponse(error="validation_error", detail="Text must not be empty."),
-                )
+                await websocket.send_text(_ERR_EMPTY_TEXT_FRAME)
                 continue
 
-            if len(text) > settings.max_text_length:
+            if len(text) > cfg.max_text_length:
                 await _send_error(
                     websocket,
                     ErrorResponse(
                         error="validation_error",
-                        detail=f"Text length exceeds limit of {settings.max_text_length} characters.",
+                        detail=f"Text length exceeds limit of {cfg.max_text_length} characters.",
                     ),
                 )
                 continue
 
             try:
-                reply = await chat_service.complete(text)
+                total = await _relay_reply(websocket, chat_service, tts_service, text)
             except ChatServiceError as exc:
                 await _send_error(
                     websocket,
@@ -96,9 +144,6 @@ async def websocket_endpoint(
                     ),
                 )
                 continue
-
-            try:
-                audio_bytes = await tts_service.synthesize(reply)
             except TtsServiceError as exc:
                 await _send_error(
                     websocket,
@@ -109,28 +154,126 @@ async def websocket_endpoint(
                 )
                 continue
 
-            await websocket.send_bytes(audio_bytes)
-            logger.info(
-                "Audio payload delivered",
-                extra={
-                    "client": _client_repr(websocket),
-                    "bytes": len(audio_bytes),
-                },
-            )
+            await websocket.send_text(_END_OF_STREAM_FRAME)
+            if logger.isEnabledFor(logging.INFO):
+                emit_event("Audio payload delivered", client=client_str, bytes=total)
     finally:
-        if should_close and websocket.application_state == WebSocketState.CONNECTED:
+        for task in (recv_task, warm_task):
+            if task.done():
+                # Retrieve any pending exception so the loop does not warn
+                # on GC.
+                with suppress(Exception):
+                    task.exception()
+            else:
+                task.cancel()
+        if should_close and websocket.application_state == connected:
             with suppress(RuntimeError, WebSocketDisconnect):
                 await websocket.close()
-        logger.info(
-            "WebSocket connection closed",
-            extra={"client": _client_repr(websocket)},
-        )
+        logger.info("WebSocket connection closed", extra=log_extra)
+
+
+async def _relay_reply(
+    websocket: WebSocket,
+    chat_service: ChatService,
+    tts_service: TtsService,
+    text: str,
+) -> int:
+    """Pipeline streamed chat sentences into TTS and forward audio in order.
+
+    The chat stream and the TTS calls are both network-bound, so overlapping
+    them cuts end-to-end latency to roughly max(T_chat, T_tts) instead of
+    their sum. Returns the total number of audio bytes sent.
+    """
+
+    queue: asyncio.Queue[asyncio.Task[bytes] | None] = asyncio.Queue(maxsize=_PIPELINE_DEPTH)
+    sentences = 0
+
+    async def _synthesize(sentence: str) -> bytes:
+        return b"".join([chunk async for chunk in tts_service.synthesize(sentence)])
+
+    async def _produce() -> None:
+        try:
+            buffer = ""
+            async for delta in chat_service.stream(text):
+                buffer += delta
+                while True:
+                    sentence, buffer = _split_sentence(buffer)
+                    if not sentence:
+                        break
+                    await _enqueue(sentence)
+            tail = buffer.strip()
+            if tail:
+                await _enqueue(tail)
+        finally:
+            # The sentinel must not be dropped: a lossy put would leave the
+            # consumer blocked on queue.get() forever. If the consumer died,
+            # its finally cancels this task out of the blocking put.
+            await queue.put(None)
+
+    async def _enqueue(sentence: str) -> None:
+        nonlocal sentences
+        task = asyncio.create_task(_synthesize(sentence))
+        try:
+            await queue.put(task)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        sentences += 1
+
+    producer = asyncio.create_task(_produce())
+    total = 0
+    buf = bytearray()
+    try:
+        while True:
+            task = await queue.get()
+            if task is None:
+                break
+            buf += await task
+            # Flush immediately when nothing else is queued (latency), or
+            # once the buffer is large enough (framing/syscall amortization).
+            if len(buf) >= _SEND_COALESCE_BYTES or queue.empty():
+                await websocket.send_bytes(bytes(buf))
+                total += len(buf)
+                buf.clear()
+        await producer
+        if sentences == 0:
+            # Parity with ChatService.complete: an empty stream is an error,
+            # not a silent end-of-stream frame with no audio.
+            raise ChatServiceError("Chat service returned empty content")
+        if buf:
+            await websocket.send_bytes(bytes(buf))
+            total += len(buf)
+    finally:
+        if not producer.done():
+            producer.cancel()
+        while not queue.empty():
+            pending = queue.get_nowait()
+            if pending is None:
+                continue
+            if pending.done():
+                # Cancel is a no-op on a finished task; retrieve the
+                # exception instead so the event loop does not warn on GC.
+                with suppress(asyncio.CancelledError):
+                    pending.exception()
+            else:
+                pending.cancel()
+    return total
+
+
+def _split_sentence(buffer: str) -> tuple[str, str]:
+    """Split the leading complete sentence off the buffer, if any."""
+
+    for index, char in enumerate(buffer):
+        if char in _SENTENCE_TERMINATORS:
+            return buffer[: index + 1].strip(), buffer[index + 1 :].lstrip()
+    return "", buffer
 
 
 async def _send_error(websocket: WebSocket, error: ErrorResponse) -> None:
     """Send a structured error frame."""
 
-    await websocket.send_text(error.model_dump_json())
+    frame = orjson.dumps({"error": error.error, "detail": error.detail})
+    await websocket.send_text(frame.decode())
 
 
 def _client_repr(websocket: WebSocket) -> str:
@@ -25,17 +25,28 @@ async def run_client(url: str, text: str, output: pathlib.Path | None, timeout:
         await websocket.send(json.dumps({"text": text}))
         logger.info("Sent text payload (%d chars)", len(text))
 
-        message = await asyncio.wait_for(websocket.recv(), timeout=timeout)
-
-        if isinstance(message, str):
-            logger.error("Received error frame: %s", message)
-            raise SystemExit(1)
+        audio = bytearray()
+        while True:
+            message = await asyncio.wait_for(websocket.recv(), timeout=timeout)
+
+            if isinstance(message, str):
+                event: dict[str, Any] = json.loads(message)
+                if event.get("event") == "end":
+                    break
+                logger.error("Received error frame: %s", message)
+                raise SystemExit(1)
+
+            if not audio:
+                logger.info(
+                    "First audio chunk after %.2fs", time.perf_counter() - start
+                )
+            audio.extend(message)
 
         elapsed = time.perf_counter() - start
-        logger.info("Received audio payload (%d bytes) in %.2fs", len(message), elapsed)
+        logger.info("Received audio payload (%d bytes) in %.2fs", len(audio), elapsed)
 
         if output:
-            output.write_bytes(message)
+            output.write_bytes(audio)
             logger.info("Audio written to %s", output)
 
 
@@ -0,0 +1,19 @@
+"""Gunicorn configuration for multi-worker deployments.
+
+Usage:
+
+    gunicorn -c gunicorn_conf.py app.main:app
+
+The service is request-scoped with no shared in-memory session state, so it
+scales across processes trivially: each worker gets its own event loop, httpx
+connection pool, and TTS cache.
+"""
+
+import multiprocessing
+import os
+
+# Mostly I/O-bound (waiting on OpenAI), so worker count above core count is
+# acceptable; WEB_CONCURRENCY overrides the cpu_count() default.
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
@@ -13,6 +13,17 @@ def settings() -> Settings:
     return Settings()
 
 
+class _StreamingBody(httpx.AsyncByteStream):
+    """Response body delivered as a real stream, not preloaded bytes."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
 @pytest.mark.asyncio
 async def test_chat_service_success(settings: Settings) -> None:
     async def handler(request: httpx.Request) -> httpx.Response:
@@ -32,13 +43,65 @@ async def test_chat_service_success(settings: Settings) -> None:
 
     transport = httpx.MockTransport(handler)
 
-    async with httpx.AsyncClient(transport=transport) as client:
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
         service = ChatService(client, settings)
         result = await service.complete("hello")
 
     assert result == "hi there"
 
 
+@pytest.mark.asyncio
+async def test_chat_service_stream_yields_deltas(settings: Settings) -> None:
+    sse_body = b"\n".join(
+        [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b'data: {"choices": [{"delta": {"content": "Hello"}}]}',
+            b'data: {"choices": [{"delta": {"content": " world."}}]}',
+            b"data: [DONE]",
+            b"",
+        ]
+    )
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content.decode())
+        assert payload["stream"] is True
+        return httpx.Response(200, content=sse_body)
+
+    transport = httpx.MockTransport(handler)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
+        service = ChatService(client, settings)
+        deltas = [delta async for delta in service.stream("hello")]
+
+    assert deltas == ["Hello", " world."]
+
+
+@pytest.mark.asyncio
+async def test_chat_service_stream_http_error_with_streamed_body(settings: Settings) -> None:
+    # A non-preloaded body reproduces production error responses: the body
+    # must be read inside the stream context or aread() raises StreamClosed.
+    async def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            500, stream=_StreamingBody([b'{"error": {"message": "fail"}}'])
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
+        service = ChatService(client, settings)
+        with pytest.raises(ChatServiceError) as exc:
+            async for _ in service.stream("hello"):
+                pass
+
+    assert exc.value.status_code == 500
+
+
 @pytest.mark.asyncio
 async def test_chat_service_timeout(settings: Settings) -> None:
     async def handler(_: httpx.Request) -> httpx.Response:
@@ -46,7 +109,9 @@ async def test_chat_service_timeout(settings: Settings) -> None:
 
     transport = httpx.MockTransport(handler)
 
-    async with httpx.AsyncClient(transport=transport) as client:
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
         service = ChatService(client, settings)
         with pytest.raises(ChatServiceError) as exc:
             await service.complete("hello")
@@ -61,7 +126,9 @@ async def test_chat_service_bad_payload(settings: Settings) -> None:
 
     transport = httpx.MockTransport(handler)
 
-    async with httpx.AsyncClient(transport=transport) as client:
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
         service = ChatService(client, settings)
         with pytest.raises(ChatServiceError):
             await service.complete("hello")
@@ -13,6 +13,17 @@ def settings() -> Settings:
     return Settings()
 
 
+class _StreamingBody(httpx.AsyncByteStream):
+    """Response body delivered as a real stream, not preloaded bytes."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
 @pytest.mark.asyncio
 async def test_tts_service_success(settings: Settings) -> None:
     async def handler(request: httpx.Request) -> httpx.Response:
@@ -23,13 +34,57 @@ async def test_tts_service_success(settings: Settings) -> None:
 
     transport = httpx.MockTransport(handler)
 
-    async with httpx.AsyncClient(transport=transport) as client:
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
         service = TtsService(client, settings)
-        audio = await service.synthesize("hello")
+        audio = b"".join([chunk async for chunk in service.synthesize("hello")])
 
     assert audio == b"\x00\x01"
 
 
+@pytest.mark.asyncio
+async def test_tts_service_streams_in_chunks(settings: Settings) -> None:
+    body = b"\xab" * (TtsService._chunk_size * 2 + 1)
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body)
+
+    transport = httpx.MockTransport(handler)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
+        service = TtsService(client, settings)
+        chunks = [chunk async for chunk in service.synthesize("hello")]
+
+    assert b"".join(chunks) == body
+    assert len(chunks) > 1
+
+
+@pytest.mark.asyncio
+async def test_tts_service_caches_repeat_prompts(settings: Settings) -> None:
+    calls = 0
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, content=b"\x00\x01")
+
+    transport = httpx.MockTransport(handler)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
+        service = TtsService(client, settings)
+        first = b"".join([chunk async for chunk in service.synthesize("hello")])
+        second = b"".join([chunk async for chunk in service.synthesize("hello")])
+        other = b"".join([chunk async for chunk in service.synthesize("goodbye")])
+
+    assert first == second == other == b"\x00\x01"
+    assert calls == 2
+
+
 @pytest.mark.asyncio
 async def test_tts_service_empty_payload(settings: Settings) -> None:
     async def handler(_: httpx.Request) -> httpx.Response:
@@ -37,10 +92,35 @@ async def test_tts_service_empty_payload(settings: Settings) -> None:
 
     transport = httpx.MockTransport(handler)
 
-    async with httpx.AsyncClient(transport=transport) as client:
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
         service = TtsService(client, settings)
         with pytest.raises(TtsServiceError):
-            await service.synthesize("hello")
+            async for _ in service.synthesize("hello"):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_tts_service_http_error_with_streamed_body(settings: Settings) -> None:
+    # A non-preloaded body reproduces production error responses: the body
+    # must be read inside the stream context or aread() raises StreamClosed.
+    async def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            429, stream=_StreamingBody([b'{"error": {"message": "rate limited"}}'])
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
+        service = TtsService(client, settings)
+        with pytest.raises(TtsServiceError) as exc:
+            async for _ in service.synthesize("hello"):
+                pass
+
+    assert exc.value.status_code == 429
 
 
 @pytest.mark.asyncio
@@ -50,7 +130,10 @@ async def test_tts_service_http_error(settings: Settings) -> None:
 
     transport = httpx.MockTransport(handler)
 
-    async with httpx.AsyncClient(transport=transport) as client:
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.openai.com"
+    ) as client:
         service = TtsService(client, settings)
         with pytest.raises(TtsServiceError):
-            await service.synthesize("hello")
+            async for _ in service.synthesize("hello"):
+                pass
@@ -4,8 +4,9 @@ import pytest
 from fastapi.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect, WebSocketState
 
-from app.config import Settings
+from app.config import build_runtime_config
 from app.dependencies import get_chat_service, get_tts_service
+from app.exceptions import ChatServiceError
 from app.models import ErrorResponse
 from app.websocket_handlers import websocket_endpoint
 
@@ -14,10 +15,16 @@ class DummyChatService:
     async def complete(self, text: str) -> str:
         return f"LLM reply to: {text}"
 
+    async def stream(self, text: str):
+        yield f"LLM reply to: {text}"
+
 
 class DummyTtsService:
-    async def synthesize(self, text: str) -> bytes:
-        return text.encode("utf-8")
+    async def synthesize(self, text: str):
+        yield text.encode("utf-8")
+
+    async def warm(self) -> None:
+        return None
 
 
 def get_test_client(app):
@@ -32,8 +39,99 @@ def test_websocket_happy_path(app) -> None:
     with client.websocket_connect("/ws") as websocket:
         websocket.send_text(json.dumps({"text": "hello"}))
         payload = websocket.receive_bytes()
+        end_frame = websocket.receive_text()
 
     assert payload == b"LLM reply to: hello"
+    assert json.loads(end_frame) == {"event": "end"}
+
+
+def test_websocket_pipelines_sentences(app) -> None:
+    class SentenceChatService(DummyChatService):
+        async def stream(self, text: str):
+            for delta in ("First sen", "tence. Sec", "ond one!", " A tail"):
+                yield delta
+
+    app.dependency_overrides[get_chat_service] = lambda: SentenceChatService()
+    app.dependency_overrides[get_tts_service] = lambda: DummyTtsService()
+    client = TestClient(app)
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text(json.dumps({"text": "hello"}))
+        # Sentence audio may arrive coalesced into fewer frames; collect
+        # binary frames until the end-of-stream text frame.
+        audio = bytearray()
+        while True:
+            frame = websocket.receive()
+            if "text" in frame:
+                end_frame = frame["text"]
+                break
+            audio.extend(frame["bytes"])
+
+    assert bytes(audio) == b"First sentence.Second one!A tail"
+    assert json.loads(end_frame) == {"event": "end"}
+
+
+def test_websocket_warms_tts_once_per_connection(app) -> None:
+    class CountingTtsService(DummyTtsService):
+        def __init__(self) -> None:
+            self.warm_calls = 0
+
+        async def warm(self) -> None:
+            self.warm_calls += 1
+
+    tts_service = CountingTtsService()
+    app.dependency_overrides[get_chat_service] = lambda: DummyChatService()
+    app.dependency_overrides[get_tts_service] = lambda: tts_service
+    client = TestClient(app)
+
+    with client.websocket_connect("/ws") as websocket:
+        for _ in range(2):
+            websocket.send_text(json.dumps({"text": "hello"}))
+            while "text" not in websocket.receive():
+                pass
+
+    assert tts_service.warm_calls == 1
+
+
+def test_websocket_chat_error_mid_stream_sends_error_frame(app) -> None:
+    class FailingChatService(DummyChatService):
+        async def stream(self, text: str):
+            yield "One sentence. "
+            raise ChatServiceError("stream interrupted")
+
+    app.dependency_overrides[get_chat_service] = lambda: FailingChatService()
+    app.dependency_overrides[get_tts_service] = lambda: DummyTtsService()
+    client = TestClient(app)
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text(json.dumps({"text": "hello"}))
+        # Audio for the completed sentence may precede the error frame.
+        while True:
+            frame = websocket.receive()
+            if "text" in frame:
+                data = json.loads(frame["text"])
+                break
+
+    assert data["error"] == "chat_error"
+
+
+def test_websocket_empty_chat_stream_sends_chat_error(app) -> None:
+    class EmptyChatService(DummyChatService):
+        async def stream(self, text: str):
+            return
+            yield  # pragma: no cover - makes this an async generator
+
+    app.dependency_overrides[get_chat_service] = lambda: EmptyChatService()
+    app.dependency_overrides[get_tts_service] = lambda: DummyTtsService()
+    client = TestClient(app)
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text(json.dumps({"text": "hello"}))
+        response = websocket.receive_text()
+
+    data = json.loads(response)
+    assert data["error"] == "chat_error"
+    assert "empty content" in data["detail"]
 
 
 def test_websocket_invalid_json(app) -> None:
@@ -60,6 +158,36 @@ def test_websocket_text_length_enforced(app) -> None:
     assert data["error"] == "validation_error"
 
 
+def test_websocket_accepts_max_length_non_ascii_text(app) -> None:
+    client = get_test_client(app)
+
+    # json.dumps defaults escape each character to 6 bytes (\uXXXX); the raw
+    # length guard must still admit a text at the configured limit.
+    text = "é" * 1000
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text(json.dumps({"text": text}))
+        payload = websocket.receive_bytes()
+        end_frame = websocket.receive_text()
+
+    assert payload == f"LLM reply to: {text}".encode("utf-8")
+    assert json.loads(end_frame) == {"event": "end"}
+
+
+def test_websocket_rejects_oversized_frame_before_parse(app) -> None:
+    client = get_test_client(app)
+
+    # Not even valid JSON: the raw-length guard must reject it before parsing.
+    oversized_frame = "x" * 7000
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text(oversized_frame)
+        response = websocket.receive_text()
+
+    data = json.loads(response)
+    assert data["error"] == "validation_error"
+
+
 class _ClientAddress:
     def __init__(self, host: str = "127.0.0.1", port: int = 12345) -> None:
         self.host = host
@@ -103,15 +231,15 @@ class DummyWebSocket:
 @pytest.mark.asyncio
 async def test_websocket_skips_close_after_client_disconnect(monkeypatch) -> None:
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    settings = Settings()
+    cfg = build_runtime_config()
     chat_service = DummyChatService()
     tts_service = DummyTtsService()
     payload = json.dumps({"text": "hello"})
     websocket = DummyWebSocket([payload, "__disconnect__"])
 
-    await websocket_endpoint(websocket, chat_service, tts_service, settings)
+    await websocket_endpoint(websocket, chat_service, tts_service, cfg)
 
     assert websocket.accepted
     assert websocket.sent_bytes == [b"LLM reply to: hello"]
-    assert websocket.sent_text == []
+    assert [json.loads(frame) for frame in websocket.sent_text] == [{"event": "end"}]
     assert websocket.close_called is False